@@ -3,12 +3,27 @@
 Fetches posts from public Reddit endpoints without OAuth authentication.
 """
 
+import functools
 import os
 import re
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional
 
-import requests
+if TYPE_CHECKING:
+    import requests
+
+# Shared session so keep-alive connections are reused across endpoints
+_SESSION = None
+
+# Pattern to match URLs (http, https, or www)
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+|www\.[^\s<>"{}|\\^`\[\]]+', re.IGNORECASE)
+
+# Pattern to extract the subreddit name from an endpoint URL
+_SUBREDDIT_RE = re.compile(r'/r/([^/]+)/')
+
+# Cheap prefilter for bare www. links, matched without lowercasing the text
+_WWW_RE = re.compile(r'www\.', re.IGNORECASE)
 
 
 def extract_urls(text: str) -> List[str]:
@@ -18,54 +33,77 @@ def extract_urls(text: str) -> List[str]:
         text: The text to extract URLs from.
         
     Returns:
-        List of unique URLs found in the text.
+        List of unique URLs found in the text, in order of appearance.
     """
     if not text:
         return []
     
-    # Pattern to match URLs (http, https, or www)
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+|www\.[^\s<>"{}|\\^`\[\]]+'
-    urls = re.findall(url_pattern, text, re.IGNORECASE)
+    # Skip the regex entirely for text that cannot contain a URL
+    if '://' not in text and not _WWW_RE.search(text):
+        return []
     
-    # Normalize URLs (add http:// to www. URLs)
-    normalized_urls = []
-    for url in urls:
-        if url.startswith('www.'):
-            url = 'http://' + url
-        normalized_urls.append(url)
+    # Normalize URLs (add http:// to www. URLs) and return them unique,
+    # in order of first appearance
+    return list(dict.fromkeys(
+        'http://' + url if url.startswith('www.') else url
+        for url in _URL_RE.findall(text)
+    ))
+
+
+def _get_session() -> 'requests.Session':
+    """Return the shared requests session, creating it on first use.
     
-    # Return unique URLs
-    return list(set(normalized_urls))
+    Returns:
+        Pooled requests session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        
+        _SESSION = requests.Session()
+        _SESSION.headers['User-Agent'] = get_user_agent()
+    return _SESSION
 
 
+@functools.lru_cache(maxsize=1)
 def get_user_agent() -> str:
     """Get User-Agent from environment variable or use default.
     
+    The value is read once per process.
+    
     Returns:
         User-Agent string for requests.
     """
     return os.getenv('REDDIT_USER_AGENT', 'CourseScoutAgent/0.1')
 
 
-def fetch_reddit_posts(url: str, max_retries: int = 2, timeout: int = 10) -> Optional[Dict[str, Any]]:
+def fetch_reddit_posts(url: str, max_retries: int = 2, timeout: int = 10) -> Optional[List[Dict[str, Any]]]:
     """Fetch posts from a Reddit JSON endpoint with retry logic.
     
+    The listing is stream-parsed so only each post's data object is
+    materialized.
+    
     Args:
         url: The Reddit JSON endpoint URL.
         max_retries: Maximum number of retry attempts.
         timeout: Request timeout in seconds.
         
     Returns:
-        Parsed JSON response as dictionary, or None if all retries fail.
+        List of post data dictionaries, or None if all retries fail.
     """
-    headers = {'User-Agent': get_user_agent()}
+    import ijson
+    import requests
+    import urllib3
     
     for attempt in range(max_retries + 1):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            with _get_session().get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                # Let urllib3 undo gzip/deflate before ijson reads the raw stream
+                response.raw.decode_content = True
+                # Reddit API returns data in a nested structure: data -> children -> data
+                return list(ijson.items(response.raw, 'data.children.item.data', use_float=True))
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, ijson.JSONError) as e:
             if attempt < max_retries:
                 # Exponential backoff: wait 1s, 2s, 4s...
                 wait_time = 2 ** attempt
@@ -125,41 +163,46 @@ def parse_reddit_post(post_data: Dict[str, Any], subreddit: str) -> Dict[str, An
     }
 
 
-def collect_reddit_posts() -> List[Dict[str, Any]]:
-    """Collect posts from Reddit public endpoints.
+def iter_reddit_posts() -> Iterator[Dict[str, Any]]:
+    """Yield parsed posts from Reddit public endpoints.
     
     Fetches posts from:
     - r/udemyfreebies
     - r/FreeUdemyCoupons
     
-    Returns:
-        List of dictionaries, one per post, with parsed information.
+    Yields:
+        Dictionary per post with parsed information.
     """
     endpoints = [
         'https://www.reddit.com/r/udemyfreebies/new.json?limit=50',
         'https://www.reddit.com/r/FreeUdemyCoupons/new.json?limit=50'
     ]
     
-    all_posts = []
+    # Create the shared session up front so the worker threads reuse it
+    _get_session()
     
-    for endpoint in endpoints:
+    # Fetch all endpoints concurrently
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        results = list(executor.map(fetch_reddit_posts, endpoints))
+    
+    for endpoint, posts in zip(endpoints, results):
         # Extract subreddit name from URL
-        subreddit_match = re.search(r'/r/([^/]+)/', endpoint)
+        subreddit_match = _SUBREDDIT_RE.search(endpoint)
         subreddit = subreddit_match.group(1) if subreddit_match else 'unknown'
         
-        # Fetch posts
-        data = fetch_reddit_posts(endpoint)
-        if not data:
+        if not posts:
             continue
         
-        # Reddit API returns data in a nested structure: data -> children -> data
-        posts = data.get('data', {}).get('children', [])
-        
-        for post_wrapper in posts:
-            post_data = post_wrapper.get('data', {})
+        for post_data in posts:
             if post_data:
-                parsed_post = parse_reddit_post(post_data, subreddit)
-                all_posts.append(parsed_post)
+                yield parse_reddit_post(post_data, subreddit)
+
+
+def collect_reddit_posts() -> List[Dict[str, Any]]:
+    """Collect posts from Reddit public endpoints.
     
-    return all_posts
+    Returns:
+        List of dictionaries, one per post, with parsed information.
+    """
+    return list(iter_reddit_posts())
 
@@ -1,32 +1,50 @@
 """Main entry point for CourseScoutAgent."""
 
+import asyncio
 import os
+import re
 import time
 
-from .collectors.reddit_public import collect_reddit_posts
-from .storage.db import init_db, insert_post_if_new, get_url_check, upsert_url_check
-from .validators.udemy import validate_udemy_url
-from .validators.base import ValidationStatus
+from .storage.db import init_db, close_db, insert_posts_bulk, get_url_checks, upsert_url_check
+
+# Matches Udemy links without lowercasing each URL
+_UDEMY_RE = re.compile(r'udemy\.com', re.IGNORECASE)
 
 # Cache validity period: 24 hours
 CACHE_TTL_SECONDS = 86400
 
+# Connection pool limits for concurrent validation
+MAX_CONNECTIONS = 64
+MAX_CONNECTIONS_PER_HOST = 8
+
+# Validation socket timeouts and DNS cache lifetime, in seconds. Only socket
+# connect/read are bounded so time spent queued for a pooled connection
+# never counts against a request
+REQUEST_TIMEOUT_SECONDS = 10
+DNS_CACHE_TTL_SECONDS = 300
 
-def validate_udemy_urls(posts, user_agent):
+
+async def validate_udemy_urls(posts, session):
     """Validate Udemy URLs from posts with caching.
     
+    URLs without a fresh cache entry are validated concurrently.
+    
     Args:
         posts: List of post dictionaries with outbound_urls field.
-        user_agent: User-Agent string for validation requests.
+        session: aiohttp session used for validation requests.
         
     Returns:
         Tuple of (total, fresh, cached, valid, invalid, unknown).
     """
+    # Imported lazily to keep startup cheap
+    from .validators.udemy import avalidate_udemy_url
+    from .validators.base import ValidationResult, ValidationStatus
+    
     # Collect all unique Udemy URLs from all posts
     udemy_urls = set()
     for post in posts:
         for url in post.get('outbound_urls', []):
-            if 'udemy.com' in url.lower():
+            if _UDEMY_RE.search(url):
                 udemy_urls.add(url)
     
     # Check for fallback URLs if no Udemy links found
@@ -45,24 +63,43 @@ def validate_udemy_urls(posts, user_agent):
     
     current_time = time.time()
     
-    # Validate each unique URL (with caching)
+    # Load all cached checks in one query
+    cache = get_url_checks(udemy_urls)
+    
+    # Split URLs into cache hits and URLs that need a fresh validation
+    statuses = []
+    needs_fresh = []
     for url in udemy_urls:
-        cached = get_url_check(url)
+        cached = cache.get(url)
         
         # Check if cache is valid (exists and not expired)
         if cached and (current_time - cached['checked_at']) < CACHE_TTL_SECONDS:
             # Reuse from cache
-            status_str = cached['status']
+            statuses.append(cached['status'])
             cached_count += 1
         else:
-            # Validate fresh
-            result = validate_udemy_url(url, user_agent)
+            needs_fresh.append(url)
+    
+    # Validate fresh URLs concurrently
+    if needs_fresh:
+        tasks = [avalidate_udemy_url(session, url) for url in needs_fresh]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for url, result in zip(needs_fresh, results):
+            fresh_count += 1
+            if not isinstance(result, ValidationResult):
+                # Unexpected failure - count as UNKNOWN without caching it
+                print(f"Error validating {url}: {result}")
+                statuses.append(ValidationStatus.UNKNOWN.value)
+                continue
+            
             status_str = result.status.value if hasattr(result.status, 'value') else str(result.status)
             # Persist result
             upsert_url_check(result)
-            fresh_count += 1
-        
-        # Count by status
+            statuses.append(status_str)
+    
+    # Count by status
+    for status_str in statuses:
         if status_str == 'VALID':
             valid_count += 1
         elif status_str == 'INVALID':
@@ -74,39 +111,59 @@ def validate_udemy_urls(posts, user_agent):
     return (total_count, fresh_count, cached_count, valid_count, invalid_count, unknown_count)
 
 
-def main():
+async def amain():
     """Fetch and store Reddit posts."""
-    # Initialize database
-    init_db()
-    
-    # Fetch posts
-    posts = collect_reddit_posts()
-    total_fetched = len(posts)
+    # Imported lazily to keep startup cheap
+    import aiohttp
     
-    # Insert posts and track counts
-    inserted_count = 0
-    duplicate_count = 0
+    from .collectors.reddit_public import collect_reddit_posts, get_user_agent
     
-    for post in posts:
-        if insert_post_if_new(post):
-            inserted_count += 1
-        else:
-            duplicate_count += 1
-    
-    # Validate Udemy URLs (with caching)
-    user_agent = os.getenv('REDDIT_USER_AGENT', 'CourseScoutAgent/0.1')
-    total, fresh, cached, valid, invalid, unknown = validate_udemy_urls(posts, user_agent)
+    # Initialize database
+    init_db()
     
-    # Print statistics
-    print(f"Total fetched: {total_fetched}")
-    print(f"Inserted: {inserted_count}")
-    print(f"Duplicates: {duplicate_count}")
-    print(f"Udemy URLs total: {total}")
-    print(f"Checked fresh: {fresh}")
-    print(f"Reused from cache: {cached}")
-    print(f"VALID: {valid}")
-    print(f"INVALID: {invalid}")
-    print(f"UNKNOWN: {unknown}")
+    try:
+        # Fetch posts
+        posts = collect_reddit_posts()
+        total_fetched = len(posts)
+        
+        # Insert posts in one transaction and track counts
+        inserted_count, duplicate_count = insert_posts_bulk(posts)
+        
+        # Validate Udemy URLs (with caching) over one pooled session
+        user_agent = get_user_agent()
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL_SECONDS
+        )
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(
+                total=None,
+                sock_connect=REQUEST_TIMEOUT_SECONDS,
+                sock_read=REQUEST_TIMEOUT_SECONDS
+            ),
+            headers={'User-Agent': user_agent},
+            connector=connector
+        ) as session:
+            total, fresh, cached, valid, invalid, unknown = await validate_udemy_urls(posts, session)
+        
+        # Print statistics
+        print(f"Total fetched: {total_fetched}")
+        print(f"Inserted: {inserted_count}")
+        print(f"Duplicates: {duplicate_count}")
+        print(f"Udemy URLs total: {total}")
+        print(f"Checked fresh: {fresh}")
+        print(f"Reused from cache: {cached}")
+        print(f"VALID: {valid}")
+        print(f"INVALID: {invalid}")
+        print(f"UNKNOWN: {unknown}")
+    finally:
+        close_db()
+
+
+def main():
+    """Run the agent once."""
+    asyncio.run(amain())
 
 
 if __name__ == '__main__':
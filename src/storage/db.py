@@ -1,20 +1,57 @@
 """SQLite storage module for CourseScoutAgent."""
 
-import json
 import os
 import sqlite3
 import time
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, List, Tuple
+
+import orjson
+
+# Stay below SQLite's default limit on bound parameters per statement
+_MAX_QUERY_PARAMS = 900
+
+# Open connections, one per database path, reused for the whole run
+_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+
+
+def _get_conn(db_path: str) -> sqlite3.Connection:
+    """Return the shared connection for a database, opening it on first use.
+    
+    Args:
+        db_path: Path to the SQLite database file.
+        
+    Returns:
+        Open SQLite connection.
+    """
+    conn = _CONNECTIONS.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        _CONNECTIONS[db_path] = conn
+    return conn
+
+
+def close_db(db_path: str = "coursescout.db") -> None:
+    """Close the shared connection for a database, if open.
+    
+    Args:
+        db_path: Path to the SQLite database file.
+    """
+    conn = _CONNECTIONS.pop(db_path, None)
+    if conn is not None:
+        conn.close()
 
 
 def init_db(db_path: str = "coursescout.db") -> None:
-    """Create the database and posts table if they don't exist.
+    """Create the database and its tables if they don't exist.
     
     Args:
         db_path: Path to the SQLite database file.
     """
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _get_conn(db_path)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -40,16 +77,106 @@ def init_db(db_path: str = "coursescout.db") -> None:
                 http_status INTEGER,
                 final_url TEXT,
                 checked_at INTEGER
-            )
+            ) WITHOUT ROWID
+        """)
+        
+        # Supports TTL sweeps over url_checks by age
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_url_checks_checked_at
+            ON url_checks(checked_at)
+        """)
+        
+        # Normalized post -> outbound URL pairs, indexed by URL
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'post_urls'")
+        post_urls_exists = cursor.fetchone() is not None
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS post_urls (
+                post_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (post_id, url)
+            ) WITHOUT ROWID
+        """)
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_post_urls_url
+            ON post_urls(url)
         """)
         
+        # Backfill from url_list the first time the table is created
+        if not post_urls_exists:
+            cursor.execute("""
+                INSERT OR IGNORE INTO post_urls (post_id, url)
+                SELECT posts.post_id, urls.value
+                FROM posts, json_each(posts.url_list) AS urls
+                WHERE json_valid(posts.url_list)
+            """)
+        
         conn.commit()
-        conn.close()
     except sqlite3.Error as e:
         print(f"Error initializing database: {e}")
         raise
 
 
+def _get_outbound_urls(post: Dict[str, Any]) -> list:
+    """Get a post's outbound URLs, always as a list.
+    
+    Args:
+        post: Dictionary containing post data.
+        
+    Returns:
+        List of outbound URLs.
+    """
+    # Map outbound_urls to url_list (handle both field names)
+    outbound_urls = post.get('outbound_urls', post.get('url_list', []))
+    if not isinstance(outbound_urls, list):
+        outbound_urls = []
+    return outbound_urls
+
+
+def _post_url_rows(post: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Convert a post's outbound URLs into post_urls table rows.
+    
+    Args:
+        post: Dictionary containing post data.
+        
+    Returns:
+        List of (post_id, url) tuples.
+    """
+    post_id = post.get('post_id', '')
+    return [(post_id, url) for url in _get_outbound_urls(post)]
+
+
+def _post_to_row(post: Dict[str, Any], inserted_at: int) -> Tuple:
+    """Convert a post dictionary into a posts table row.
+    
+    Args:
+        post: Dictionary containing post data.
+        inserted_at: Timestamp to record as inserted_at.
+        
+    Returns:
+        Tuple of column values in posts table order.
+    """
+    # Extract fields safely with defaults
+    post_id = post.get('post_id', '')
+    source = post.get('source', '')
+    subreddit = post.get('subreddit')
+    title = post.get('title')
+    content = post.get('content')
+    outbound_urls = _get_outbound_urls(post)
+    author = post.get('author')
+    created_utc = post.get('created_utc')
+    permalink = post.get('permalink')
+    
+    # JSON-encode url_list
+    url_list_json = orjson.dumps(outbound_urls).decode()
+    
+    return (
+        post_id, source, subreddit, title, content,
+        url_list_json, author, created_utc, permalink, inserted_at
+    )
+
+
 def insert_post_if_new(post: Dict[str, Any], db_path: str = "coursescout.db") -> bool:
     """Insert a post if it doesn't already exist.
     
@@ -61,48 +188,28 @@ def insert_post_if_new(post: Dict[str, Any], db_path: str = "coursescout.db") ->
         True if the post was inserted, False if it already exists.
     """
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Extract fields safely with defaults
-        post_id = post.get('post_id', '')
-        source = post.get('source', '')
-        subreddit = post.get('subreddit')
-        title = post.get('title')
-        content = post.get('content')
-        # Map outbound_urls to url_list (handle both field names)
-        outbound_urls = post.get('outbound_urls', post.get('url_list', []))
-        author = post.get('author')
-        created_utc = post.get('created_utc')
-        permalink = post.get('permalink')
-        
-        # JSON-encode url_list (always as a list)
-        if not isinstance(outbound_urls, list):
-            outbound_urls = []
-        url_list_json = json.dumps(outbound_urls)
-        
-        # Get current timestamp for inserted_at
-        inserted_at = int(time.time())
+        conn = _get_conn(db_path)
         
-        # Check if post_id already exists
-        cursor.execute("SELECT 1 FROM posts WHERE post_id = ?", (post_id,))
-        if cursor.fetchone():
-            conn.close()
-            return False
+        row = _post_to_row(post, int(time.time()))
         
-        # Insert the post
-        cursor.execute("""
-            INSERT INTO posts (
-                post_id, source, subreddit, title, content,
-                url_list, author, created_utc, permalink, inserted_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            post_id, source, subreddit, title, content,
-            url_list_json, author, created_utc, permalink, inserted_at
-        ))
+        with conn:
+            # Check if post_id already exists
+            cursor = conn.execute("SELECT 1 FROM posts WHERE post_id = ?", (row[0],))
+            if cursor.fetchone():
+                return False
+            
+            # Insert the post
+            conn.execute("""
+                INSERT INTO posts (
+                    post_id, source, subreddit, title, content,
+                    url_list, author, created_utc, permalink, inserted_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, row)
+            
+            conn.executemany("""
+                INSERT OR IGNORE INTO post_urls (post_id, url) VALUES (?, ?)
+            """, _post_url_rows(post))
         
-        conn.commit()
-        conn.close()
         return True
         
     except sqlite3.Error as e:
@@ -113,6 +220,83 @@ def insert_post_if_new(post: Dict[str, Any], db_path: str = "coursescout.db") ->
         raise
 
 
+def _get_existing_post_ids(conn: sqlite3.Connection, post_ids: List[str]) -> set:
+    """Return which of the given post ids are already stored.
+    
+    Args:
+        conn: Open SQLite connection.
+        post_ids: Post ids to look up.
+        
+    Returns:
+        Set of post ids present in the posts table.
+    """
+    existing = set()
+    for start in range(0, len(post_ids), _MAX_QUERY_PARAMS):
+        chunk = post_ids[start:start + _MAX_QUERY_PARAMS]
+        placeholders = ','.join('?' * len(chunk))
+        cursor = conn.execute(
+            f"SELECT post_id FROM posts WHERE post_id IN ({placeholders})", chunk
+        )
+        existing.update(row[0] for row in cursor)
+    return existing
+
+
+def insert_posts_bulk(posts: Iterable[Dict[str, Any]], db_path: str = "coursescout.db") -> Tuple[int, int]:
+    """Insert many posts in a single transaction, skipping existing ones.
+    
+    Args:
+        posts: Iterable of dictionaries containing post data.
+        db_path: Path to the SQLite database file.
+        
+    Returns:
+        Tuple of (inserted, duplicates) counts.
+    """
+    try:
+        posts = list(posts)
+        inserted_at = int(time.time())
+        rows = [_post_to_row(post, inserted_at) for post in posts]
+        
+        conn = _get_conn(db_path)
+        
+        with conn:
+            # Take the write lock before the existence check, so a concurrent
+            # run can't store one of these posts between the check and the insert
+            conn.execute("BEGIN IMMEDIATE")
+            
+            # Keep only posts not stored yet, first occurrence wins within the batch
+            seen_ids = _get_existing_post_ids(conn, list({row[0] for row in rows}))
+            new_rows = []
+            url_rows = []
+            for post, row in zip(posts, rows):
+                if row[0] in seen_ids:
+                    continue
+                seen_ids.add(row[0])
+                new_rows.append(row)
+                url_rows.extend(_post_url_rows(post))
+            
+            cursor = conn.executemany("""
+                INSERT OR IGNORE INTO posts (
+                    post_id, source, subreddit, title, content,
+                    url_list, author, created_utc, permalink, inserted_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, new_rows)
+            inserted = cursor.rowcount
+            
+            # URLs are only recorded for posts inserted here, matching url_list
+            conn.executemany("""
+                INSERT OR IGNORE INTO post_urls (post_id, url) VALUES (?, ?)
+            """, url_rows)
+        
+        return (inserted, len(rows) - inserted)
+        
+    except sqlite3.Error as e:
+        print(f"Error inserting posts: {e}")
+        raise
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Error processing post data: {e}")
+        raise
+
+
 def upsert_url_check(result, db_path: str = "coursescout.db") -> None:
     """Insert or update a URL check result.
     
@@ -147,22 +331,19 @@ def upsert_url_check(result, db_path: str = "coursescout.db") -> None:
         checked_at = int(time.time())
     
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        conn = _get_conn(db_path)
         
-        cursor.execute("""
-            INSERT INTO url_checks (url, status, reason, http_status, final_url, checked_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(url) DO UPDATE SET
-                status = excluded.status,
-                reason = excluded.reason,
-                http_status = excluded.http_status,
-                final_url = excluded.final_url,
-                checked_at = excluded.checked_at
-        """, (url, status, reason, http_status, final_url, checked_at))
-        
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute("""
+                INSERT INTO url_checks (url, status, reason, http_status, final_url, checked_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    status = excluded.status,
+                    reason = excluded.reason,
+                    http_status = excluded.http_status,
+                    final_url = excluded.final_url,
+                    checked_at = excluded.checked_at
+            """, (url, status, reason, http_status, final_url, checked_at))
     except sqlite3.Error as e:
         print(f"Error upserting URL check: {e}")
         raise
@@ -179,16 +360,14 @@ def get_url_check(url: str, db_path: str = "coursescout.db") -> dict | None:
         Dict with url, status, reason, http_status, final_url, checked_at or None.
     """
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        conn = _get_conn(db_path)
         
-        cursor.execute("""
+        cursor = conn.execute("""
             SELECT url, status, reason, http_status, final_url, checked_at
             FROM url_checks WHERE url = ?
         """, (url,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return {
@@ -203,3 +382,40 @@ def get_url_check(url: str, db_path: str = "coursescout.db") -> dict | None:
     except sqlite3.Error as e:
         print(f"Error getting URL check: {e}")
         raise
+
+
+def get_url_checks(urls: Iterable[str], db_path: str = "coursescout.db") -> Dict[str, Dict[str, Any]]:
+    """Retrieve cached check status for many URLs at once.
+    
+    Args:
+        urls: The URLs to look up.
+        db_path: Path to the SQLite database file.
+        
+    Returns:
+        Dict mapping each cached URL to a dict with url, status, checked_at.
+        URLs without a stored check are omitted.
+    """
+    urls = list(urls)
+    checks = {}
+    try:
+        conn = _get_conn(db_path)
+        
+        for start in range(0, len(urls), _MAX_QUERY_PARAMS):
+            chunk = urls[start:start + _MAX_QUERY_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = conn.execute(f"""
+                SELECT url, status, checked_at
+                FROM url_checks WHERE url IN ({placeholders})
+            """, chunk)
+            
+            for row in cursor:
+                checks[row[0]] = {
+                    'url': row[0],
+                    'status': row[1],
+                    'checked_at': row[2]
+                }
+        
+        return checks
+    except sqlite3.Error as e:
+        print(f"Error getting URL checks: {e}")
+        raise
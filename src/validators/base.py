@@ -1,13 +1,40 @@
 """Base validation framework for CourseScoutAgent."""
 
+import asyncio
+import functools
 import html.parser
 import re
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
 
-import requests
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
+# Statuses that decide validation on their own, so the body is never downloaded
+_SKIP_BODY_STATUSES = (404, 429)
+
+# Shared session so keep-alive connections are reused across validations
+_SESSION = None
+
+
+def _get_session() -> 'requests.Session':
+    """Return the shared requests session, creating it on first use.
+    
+    Returns:
+        Pooled requests session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        _SESSION = requests.Session()
+        _SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+        _SESSION.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+    return _SESSION
 
 
 class ValidationStatus(Enum):
@@ -27,8 +54,38 @@ class ValidationResult:
     http_status: Optional[int] = None
 
 
+class LxmlTextTarget:
+    """lxml parser target that collects text without building a tree.
+    
+    libxml2 splits text around entity references, so consecutive chunks
+    are joined as-is and a separator is only added at element boundaries.
+    """
+    
+    def __init__(self):
+        self.text_parts = []
+    
+    def start(self, tag, attrib):
+        """Separate text on opening tags."""
+        self.text_parts.append(' ')
+    
+    def end(self, tag):
+        """Separate text on closing tags."""
+        self.text_parts.append(' ')
+    
+    def data(self, data):
+        """Collect text data."""
+        self.text_parts.append(data)
+    
+    def close(self) -> str:
+        """Get extracted text."""
+        return ''.join(self.text_parts)
+
+
 class HTMLTextExtractor(html.parser.HTMLParser):
-    """Simple HTML parser to extract plain text."""
+    """Simple HTML parser to extract plain text.
+    
+    Only used when neither selectolax nor lxml is available.
+    """
     
     def __init__(self):
         super().__init__()
@@ -43,6 +100,45 @@ class HTMLTextExtractor(html.parser.HTMLParser):
         return ' '.join(self.text_parts)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_text_parser() -> Callable[[str], str]:
+    """Return the HTML-to-text function for the best available parser.
+    
+    C-backed parsers are preferred in this order: selectolax, then lxml,
+    with html.parser as the last resort. They are imported on first use.
+    
+    Returns:
+        Function mapping HTML content to its raw text.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        pass
+    else:
+        def selectolax_text(html_content: str) -> str:
+            return LexborHTMLParser(html_content).text(separator=' ', strip=True)
+        
+        return selectolax_text
+    
+    try:
+        from lxml import etree
+    except ImportError:
+        pass
+    else:
+        def lxml_text(html_content: str) -> str:
+            parser = etree.HTMLParser(target=LxmlTextTarget(), encoding='utf-8')
+            return etree.fromstring(html_content.encode('utf-8', 'replace'), parser)
+        
+        return lxml_text
+    
+    def html_parser_text(html_content: str) -> str:
+        parser = HTMLTextExtractor()
+        parser.feed(html_content)
+        return parser.get_text()
+    
+    return html_parser_text
+
+
 def extract_plain_text(html_content: str, max_length: int = 2000) -> str:
     """Extract plain text from HTML content.
     
@@ -54,9 +150,7 @@ def extract_plain_text(html_content: str, max_length: int = 2000) -> str:
         Plain text extracted from HTML, truncated to max_length.
     """
     try:
-        parser = HTMLTextExtractor()
-        parser.feed(html_content)
-        text = parser.get_text()
+        text = _get_text_parser()(html_content)
         
         # Clean up whitespace
         text = ' '.join(text.split())
@@ -78,6 +172,8 @@ def fetch_url(
 ) -> Tuple[Optional[int], Optional[str], str]:
     """Fetch a URL and return status, final URL, and text snippet.
     
+    The response is streamed, and for 404 and 429 the body is never read.
+    
     Args:
         url: The URL to fetch.
         user_agent: User-Agent header value.
@@ -87,25 +183,31 @@ def fetch_url(
         Tuple of (http_status, final_url, body_text_snippet).
         Returns (None, None, "") on network errors.
     """
+    import requests
+    
     headers = {'User-Agent': user_agent}
     max_retries = 2
     
     for attempt in range(max_retries + 1):
         try:
-            response = requests.get(
+            with _get_session().get(
                 url,
                 headers=headers,
                 timeout=timeout_sec,
-                allow_redirects=True
-            )
-            
-            # Get final URL after redirects
-            final_url = response.url
-            
-            # Extract plain text from HTML
-            body_text_snippet = extract_plain_text(response.text)
-            
-            return (response.status_code, final_url, body_text_snippet)
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                # Get final URL after redirects
+                final_url = response.url
+                
+                # Skip the body when the status alone decides the result
+                if response.status_code in _SKIP_BODY_STATUSES:
+                    return (response.status_code, final_url, "")
+                
+                # Extract plain text from HTML
+                body_text_snippet = extract_plain_text(response.text)
+                
+                return (response.status_code, final_url, body_text_snippet)
             
         except requests.exceptions.RequestException:
             if attempt < max_retries:
@@ -117,3 +219,56 @@ def fetch_url(
     
     return (None, None, "")
 
+
+async def afetch_url(
+    session: 'aiohttp.ClientSession',
+    url: str
+) -> Tuple[Optional[int], Optional[str], str]:
+    """Asynchronously fetch a URL and return status, final URL, and text snippet.
+    
+    Async counterpart of fetch_url, so many URLs can be validated
+    concurrently over a shared aiohttp session. Headers and timeout
+    come from the session. As in fetch_url, the body is not read for
+    404 and 429.
+    
+    Args:
+        session: The aiohttp session to issue the request with.
+        url: The URL to fetch.
+        
+    Returns:
+        Tuple of (http_status, final_url, body_text_snippet).
+        Returns (None, None, "") on network errors.
+    """
+    import aiohttp
+    
+    max_retries = 2
+    
+    for attempt in range(max_retries + 1):
+        try:
+            async with session.get(url, allow_redirects=True) as response:
+                # Get final URL after redirects
+                final_url = str(response.url)
+                
+                # Skip the body when the status alone decides the result
+                if response.status in _SKIP_BODY_STATUSES:
+                    return (response.status, final_url, "")
+                
+                # Extract plain text from HTML
+                body = await response.text(errors='replace')
+                
+                # Parse in a worker thread so other fetches keep running
+                body_text_snippet = await asyncio.get_running_loop().run_in_executor(
+                    None, extract_plain_text, body
+                )
+                
+                return (response.status, final_url, body_text_snippet)
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt < max_retries:
+                # Exponential backoff: wait 0.5s, 1s
+                await asyncio.sleep(0.5 * 2 ** attempt)
+            else:
+                # All retries failed
+                return (None, None, "")
+    
+    return (None, None, "")
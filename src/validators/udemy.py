@@ -1,7 +1,36 @@
 """Udemy-specific URL validator for CourseScoutAgent."""
 
+import re
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    import aiohttp
+
 #from validators.base import ValidationResult, ValidationStatus, fetch_url
-from .base import ValidationResult, ValidationStatus, fetch_url
+from .base import ValidationResult, ValidationStatus, afetch_url, fetch_url
+
+# Page phrases indicating the course is gone
+INVALID_KEYWORDS = [
+    "course is no longer available",
+    "we couldn't find the page",
+    "we could not find the page",
+    "not found"
+]
+
+# Page phrases indicating the course is behind authentication
+UNKNOWN_KEYWORDS = [
+    "please log in",
+    "access denied"
+]
+
+# All keywords compiled once into a single case-insensitive pattern, with one
+# named group per keyword ('invalid_0', 'unknown_1', ...) giving its status
+# and list position, so each page is scanned in one pass
+_KEYWORD_RE = re.compile('|'.join(
+    f'(?P<{status}_{index}>{re.escape(keyword)})'
+    for status, keywords in (('invalid', INVALID_KEYWORDS), ('unknown', UNKNOWN_KEYWORDS))
+    for index, keyword in enumerate(keywords)
+), re.IGNORECASE)
 
 
 def validate_udemy_url(url: str, user_agent: str) -> ValidationResult:
@@ -17,8 +46,70 @@ def validate_udemy_url(url: str, user_agent: str) -> ValidationResult:
     # Fetch the URL
     http_status, final_url, text_snippet = fetch_url(url, user_agent)
     
-    text_lower = text_snippet.lower()
+    return _classify_response(url, http_status, final_url, text_snippet)
+
+
+async def avalidate_udemy_url(session: 'aiohttp.ClientSession', url: str) -> ValidationResult:
+    """Asynchronously validate a Udemy course URL.
     
+    Args:
+        session: The aiohttp session to issue the request with.
+        url: The Udemy URL to validate.
+        
+    Returns:
+        ValidationResult with status, reason, and metadata.
+    """
+    # Fetch the URL
+    http_status, final_url, text_snippet = await afetch_url(session, url)
+    
+    return _classify_response(url, http_status, final_url, text_snippet)
+
+
+def _scan_keywords(text_snippet: str) -> Tuple[Optional[str], Optional[str]]:
+    """Find the INVALID and UNKNOWN keywords present in a page snippet.
+    
+    When several keywords of one status appear, the one listed first in
+    INVALID_KEYWORDS or UNKNOWN_KEYWORDS is reported.
+    
+    Args:
+        text_snippet: Plain text snippet of the page body.
+        
+    Returns:
+        Tuple of (invalid_keyword, unknown_keyword) as listed, None if absent.
+    """
+    # Lowest list index found so far per status
+    found = {'invalid': None, 'unknown': None}
+    for match in _KEYWORD_RE.finditer(text_snippet):
+        status, index = match.lastgroup.rsplit('_', 1)
+        index = int(index)
+        if found[status] is None or index < found[status]:
+            found[status] = index
+            # The top INVALID keyword decides the result, stop scanning
+            if status == 'invalid' and index == 0:
+                break
+    
+    invalid_keyword = None if found['invalid'] is None else INVALID_KEYWORDS[found['invalid']]
+    unknown_keyword = None if found['unknown'] is None else UNKNOWN_KEYWORDS[found['unknown']]
+    return (invalid_keyword, unknown_keyword)
+
+
+def _classify_response(
+    url: str,
+    http_status: Optional[int],
+    final_url: Optional[str],
+    text_snippet: str
+) -> ValidationResult:
+    """Classify a fetched Udemy page as VALID, INVALID or UNKNOWN.
+    
+    Args:
+        url: The Udemy URL that was fetched.
+        http_status: HTTP status code, or None on network errors.
+        final_url: Final URL after redirects.
+        text_snippet: Plain text snippet of the page body.
+        
+    Returns:
+        ValidationResult with status, reason, and metadata.
+    """
     # Check for INVALID conditions
     if http_status == 404:
         return ValidationResult(
@@ -29,22 +120,16 @@ def validate_udemy_url(url: str, user_agent: str) -> ValidationResult:
             http_status=http_status
         )
     
-    invalid_keywords = [
-        "course is no longer available",
-        "we couldn't find the page",
-        "we could not find the page",
-        "not found"
-    ]
+    invalid_keyword, unknown_keyword = _scan_keywords(text_snippet)
     
-    for keyword in invalid_keywords:
-        if keyword in text_lower:
-            return ValidationResult(
-                url=url,
-                status=ValidationStatus.INVALID,
-                reason=f"Page indicates unavailability: '{keyword}'",
-                final_url=final_url,
-                http_status=http_status
-            )
+    if invalid_keyword:
+        return ValidationResult(
+            url=url,
+            status=ValidationStatus.INVALID,
+            reason=f"Page indicates unavailability: '{invalid_keyword}'",
+            final_url=final_url,
+            http_status=http_status
+        )
     
     # Check for UNKNOWN conditions
     if http_status == 429:
@@ -65,20 +150,14 @@ def validate_udemy_url(url: str, user_agent: str) -> ValidationResult:
             http_status=http_status
         )
     
-    unknown_keywords = [
-        "please log in",
-        "access denied"
-    ]
-    
-    for keyword in unknown_keywords:
-        if keyword in text_lower:
-            return ValidationResult(
-                url=url,
-                status=ValidationStatus.UNKNOWN,
-                reason=f"Requires authentication: '{keyword}'",
-                final_url=final_url,
-                http_status=http_status
-            )
+    if unknown_keyword:
+        return ValidationResult(
+            url=url,
+            status=ValidationStatus.UNKNOWN,
+            reason=f"Requires authentication: '{unknown_keyword}'",
+            final_url=final_url,
+            http_status=http_status
+        )
     
     # Otherwise assume VALID
     return ValidationResult(